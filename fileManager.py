@@ -1,4 +1,10 @@
-def readFromFile(fileName: str, deliniator: str = None) -> list:
+import os
+import threading
+from contextlib import contextmanager, suppress
+from typing import Any, Iterator
+
+
+def readFromFile(fileName: str, deliniator: str | None = None) -> list[Any]:
     """
     Reads data from a file and returns a list of its contents. 
 
@@ -8,14 +14,16 @@ def readFromFile(fileName: str, deliniator: str = None) -> list:
              each line is split into a list based on the delimiter.
     """
 
-    fileData = []  # Initialize an empty list to store file contents
+    fileData: list[Any] = []  # Initialize an empty list to store file contents
 
     try:
-        with open(fileName, "r") as file:
-            if deliniator is not None:
-                fileData = [line.strip().split(deliniator) for line in file]  # Read and split each line
-            else:
-                fileData = [line.strip() for line in file]  # Read and strip each line
+        with open(fileName, "rb") as file:
+            lines = file.read().splitlines()  # Read the whole file at once and split it into lines
+
+        if deliniator is not None:
+            fileData = [line.strip().decode().split(deliniator) for line in lines]  # Strip and split each line
+        else:
+            fileData = [line.strip().decode() for line in lines]  # Strip each line
 
     except FileNotFoundError:
         print(f"Warning: {fileName} not found. Returning an empty list.")
@@ -26,3 +34,26 @@ def readFromFile(fileName: str, deliniator: str = None) -> list:
         return []
 
     return fileData
+
+
+@contextmanager
+def atomicWritePath(filePath: str) -> Iterator[str]:
+    """
+    Yields a temporary path to write a file to, then moves the written file over filePath.
+
+    Writing to a temporary file first means readers never see a partially written file. The
+    temporary name includes the process and thread IDs, so concurrent writers never share one.
+    If the write fails, the temporary file is removed and filePath is left unchanged.
+
+    :param filePath: Path of the file to write.
+    :return: The temporary path to write the file's contents to.
+    """
+    tempPath = f"{filePath}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+    try:
+        yield tempPath
+        os.replace(tempPath, filePath)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tempPath)  # Remove whatever was written before the failure
+        raise
@@ -1,6 +1,15 @@
+import os
 import time
-from fredapi import Fred
-from datetime import datetime, timedelta
+import random
+import hashlib
+import threading
+import requests
+import pandas as pd
+from requests.adapters import HTTPAdapter
+from fileManager import atomicWritePath
+
+# FRED REST endpoint for series observations
+FRED_OBSERVATIONS_URL = "https://api.stlouisfed.org/fred/series/observations"
 
 class FredApiClient:
     """
@@ -8,75 +17,210 @@ class FredApiClient:
     
     This class manages sending requests to the FRED API, while ensuring that the rate limit
     of 120 requests per minute is respected. If the rate limit is exceeded, it will retry up to 6 times
-    with a 20-second delay between each attempt.
+    using exponential backoff with jitter between each attempt. The client is safe to share between threads.
+
+    Downloaded series are cached on disk for 24 hours, so re-running a download does not
+    request series that were fetched recently.
+
+    Requests go straight to the FRED REST API through one shared `requests.Session`, so every
+    series reuses pooled keep-alive connections instead of opening a new one per request.
     """
     
-    def __init__(self, apiKey):
+    def __init__(self, apiKey, cacheDir=".cache/fred"):
         """
         Initialize the FredApiClient class with the given API key.
         
         :param apiKey: The API key to access FRED data.
+        :param cacheDir: Directory where downloaded series are cached.
+        :raises ValueError: If apiKey is not a non-empty string.
         """
+        # Fail fast instead of sending every request with an invalid key
+        if not isinstance(apiKey, str) or not apiKey:
+            raise ValueError(f"Expected a non-empty API key string, got {type(apiKey).__name__}.")
+
         self.apiKey = apiKey
-        self.fred = Fred(api_key=self.apiKey)  # Create an instance of the Fred class with the provided API key
+        self.session = requests.Session()  # Shared HTTP session so connections are reused between requests
+        self.session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+        self.requestTimeout = 30  # Seconds to wait for FRED to respond
         self.retryLimit = 6
-        self.retryDelay = 20
-        self.requestTimes = []  # List to track request times for rate limit control
+        self.maxRetryDelay = 60  # Upper bound on the backoff between retries, in seconds
+        self.requestLimit = 120  # FRED allows at most 120 requests per minute
+        self.capacity = 20.0  # Maximum number of requests that can be made in a burst
+        # Tokens added per second; a full bucket plus one minute of refills never exceeds the limit
+        self.refillRate = (self.requestLimit - self.capacity) / 60
+        self.tokens = self.capacity  # Requests currently available
+        self.lastRefill = time.monotonic()  # Time the token count was last updated
+        self.requestLock = threading.Lock()  # Guards the token bucket when requests come from multiple threads
+        self.cacheDir = cacheDir
+        self.cacheMaxAge = 24 * 60 * 60  # Seconds before a cached series is downloaded again
     
     def trackRequests(self):
         """
-        Tracks the time of each request to ensure that no more than 120 requests are made per minute.
+        Ensures that no more than 120 requests are made per minute using a token bucket.
         
-        This function adds the current time of each request to the `requestTimes` list and removes
-        any times that are older than 1 minute to ensure the list only contains times within the last minute.
-        If more than 120 requests are made within the last minute, it will wait for the next available time window.
+        The bucket holds up to 20 tokens and refills at 100 tokens per minute, so any 60 second
+        window allows at most 20 + 100 = 120 requests, even when it starts with a full bucket.
+        Each request consumes one token; if none are available, it will wait until the next token is added.
+        The lock is held while waiting so that concurrent callers queue up behind the limiter.
         """
-        currentTime = datetime.now()
+        with self.requestLock:
+            currentTime = time.monotonic()
 
-        # Remove request times that are older than 1 minute
-        self.requestTimes = [t for t in self.requestTimes if currentTime - t < timedelta(minutes=1)]
+            # Refill the bucket for the time elapsed since the last request
+            self.tokens = min(self.capacity, self.tokens + (currentTime - self.lastRefill) * self.refillRate)
+            self.lastRefill = currentTime
 
-        if len(self.requestTimes) >= 120:
-            # If more than 120 requests have been made in the last minute, wait until the next minute
-            waitTime = 60 - (currentTime - self.requestTimes[0]).seconds
-            print(f"Request limit reached. Waiting for {waitTime} seconds.")
-            time.sleep(waitTime)
-        
-        # Add the current time to the requestTimes list
-        self.requestTimes.append(currentTime)
+            if self.tokens < 1:
+                # If the bucket is empty, wait until the next token becomes available
+                waitTime = (1 - self.tokens) / self.refillRate
+                print(f"Request limit reached. Waiting for {waitTime:.2f} seconds.")
+                time.sleep(waitTime)
+                self.tokens = 0
+                self.lastRefill = time.monotonic()
+            else:
+                # Consume a token for this request
+                self.tokens -= 1
+    
+    def getRetryDelay(self, error, attempt):
+        """
+        Computes how long to wait before retrying a rate limited request.
+
+        A Retry-After header is honored if the error carries one. Otherwise the delay doubles
+        with each attempt, plus random jitter so that concurrent callers do not retry in lockstep.
+
+        :param error: The exception raised by the rate limited request.
+        :param attempt: The number of attempts made so far.
+        :return: The number of seconds to wait, capped at `maxRetryDelay`.
+        """
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        retryAfter = headers.get("Retry-After") if headers is not None else None
+
+        if retryAfter is not None:
+            try:
+                return min(self.maxRetryDelay, float(retryAfter))
+            except ValueError:
+                pass  # Retry-After given as an HTTP date, fall back to backoff
+
+        return min(self.maxRetryDelay, (2 ** attempt) + random.uniform(0, 1))
     
-    def getSeries(self, seriesId, startDate=None, endDate=None, maxAttempts=6):
+    def fetchSeries(self, seriesId, startDate=None, endDate=None):
+        """
+        Downloads the observations for a series from the FRED REST API.
+
+        Missing observations (reported by FRED as ".") are returned as NaN.
+
+        :param seriesId: The FRED series ID to fetch data for.
+        :param startDate: The start date for the data (YYYY-MM-DD, optional).
+        :param endDate: The end date for the data (YYYY-MM-DD, optional).
+        :return: A pandas Series of float values indexed by observation date.
+        :raises requests.HTTPError: If FRED responds with an error status.
+        """
+        params = {"series_id": seriesId, "api_key": self.apiKey, "file_type": "json"}
+        if startDate is not None:
+            params["observation_start"] = pd.to_datetime(startDate).strftime("%Y-%m-%d")
+        if endDate is not None:
+            params["observation_end"] = pd.to_datetime(endDate).strftime("%Y-%m-%d")
+
+        response = self.session.get(FRED_OBSERVATIONS_URL, params=params, timeout=self.requestTimeout)
+
+        if not response.ok:
+            # Report FRED's own error message, which does not include the request URL or API key
+            try:
+                message = response.json().get("error_message", response.reason)
+            except ValueError:
+                message = response.reason
+            raise requests.HTTPError(f"{response.status_code} {message}", response=response)
+
+        observations = response.json()["observations"]
+        dates = pd.to_datetime([observation["date"] for observation in observations], format="%Y-%m-%d")
+        values = pd.to_numeric([observation["value"] for observation in observations], errors="coerce")
+        return pd.Series(values, index=dates, dtype="float64")
+
+    def getCachePath(self, seriesId, startDate=None, endDate=None):
+        """
+        Builds the cache file path for a series request.
+
+        :param seriesId: The FRED series ID.
+        :param startDate: The start date of the request (optional).
+        :param endDate: The end date of the request (optional).
+        :return: The path of the cache file for this (seriesId, startDate, endDate) request.
+        """
+        key = hashlib.sha1(f"{seriesId}|{startDate}|{endDate}".encode()).hexdigest()
+        return os.path.join(self.cacheDir, f"{key}.parquet")
+
+    def readCache(self, cachePath):
+        """
+        Reads a cached series if it exists and is younger than `cacheMaxAge`.
+
+        :param cachePath: The path of the cache file.
+        :return: The cached pandas Series, or None if it is missing, stale, or unreadable.
+        """
+        try:
+            if time.time() - os.path.getmtime(cachePath) >= self.cacheMaxAge:
+                return None
+            return pd.read_parquet(cachePath)["value"].rename(None).rename_axis(None)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Warning: Could not read cache file {cachePath}: {e}")
+            return None
+
+    def writeCache(self, cachePath, data):
+        """
+        Writes a downloaded series to the cache as a Parquet file. Failures are reported but never raised.
+
+        :param cachePath: The path of the cache file.
+        :param data: The pandas Series to cache.
+        """
+        try:
+            os.makedirs(self.cacheDir, exist_ok=True)
+            with atomicWritePath(cachePath) as tempPath:
+                data.rename("value").to_frame().to_parquet(tempPath)
+        except Exception as e:
+            print(f"Warning: Could not write cache file {cachePath}: {e}")
+
+    def getSeries(self, seriesId, startDate=None, endDate=None, maxAttempts=6, forceRefresh=False):
         """
         Retrieves a time series from the FRED API while respecting the rate limit.
 
+        A cached copy is returned instead if the same request was downloaded within the last 24 hours.
+
         :param series_id: The FRED series ID to fetch data for.
         :param start_date: The start date for the data (YYYY-MM-DD, optional).
         :param end_date: The end date for the data (YYYY-MM-DD, optional).
         :param max_attempts: Maximum retry attempts if rate limit is exceeded.
+        :param forceRefresh: Download the series even if a fresh cached copy exists.
         :return: A pandas Series containing the requested FRED data.
         """
+        cachePath = self.getCachePath(seriesId, startDate, endDate)
+
+        if not forceRefresh:
+            data = self.readCache(cachePath)
+            if data is not None:
+                return data
+
         attempt = 0
 
         while attempt < maxAttempts:
             try:
                 self.trackRequests()  # Ensure we are within the request limit
 
-                # If user a date range was not inputted, get all the data for the series
-                if (startDate is None and endDate is None):
-                    data = self.fred.get_series(seriesId)
-                # Otherwise, get the data in the time period
-                else:
-                    data = self.fred.get_series(seriesId, observation_start=startDate, observation_end=endDate)
+                # Get the data in the time period, or all the data if no dates were given
+                data = self.fetchSeries(seriesId, startDate, endDate)
+
+                self.writeCache(cachePath, data)
                 return data  # Return the retrieved series
 
             except Exception as e:
-                errorMsg = str(e)
+                errorMsg = str(e).replace(self.apiKey, "<API key>")  # Never print the API key
                 
                 if "429" in errorMsg:
                     # Rate limit exceeded, apply retry mechanism
                     attempt += 1
-                    print(f"Rate limit exceeded. Retrying in {self.retryDelay} seconds (Attempt {attempt}/{maxAttempts})...")
-                    time.sleep(self.retryDelay)
+                    retryDelay = self.getRetryDelay(e, attempt)
+                    print(f"Rate limit exceeded. Retrying in {retryDelay:.1f} seconds (Attempt {attempt}/{maxAttempts})...")
+                    time.sleep(retryDelay)
                 else:
                     # Other errors (e.g., network, invalid API key, etc.)
                     print(f"Error fetching series {seriesId}: {errorMsg}")
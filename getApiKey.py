@@ -12,10 +12,15 @@ Functions:
     - getUserApiKey: Prompts the user to input their API key and returns it.
     - getApiKey: Returns the API key, either by fetching the personal one or prompting the user for it.
 
+getPersonalKey is memoized, so the key file is only read once per process.
+
 Author: [Your Name]
 Date: [Today's Date]
 """
 
+import functools
+
+@functools.lru_cache(maxsize=1)
 def getPersonalKey(fileName="apiKeys.txt") -> str:
     """
     Retrieves the personal API key from the specified file.
@@ -47,17 +52,16 @@ def getUserApiKey() -> str:
     Returns:
         str: The user-input API key.
     """
-    userApiKey = input("Please enter your API key: ")
+    # Keep prompting until the user confirms the key they entered
+    while True:
+        userApiKey = input("Please enter your API key: ")
 
-    # Print entered key and ask for confirmation
-    print(f"You entered: {userApiKey}")
-    valid = input("Enter 'Y' to confirm or 'N' to try again: ").lower()
+        # Print entered key and ask for confirmation
+        print(f"You entered: {userApiKey}")
+        valid = input("Enter 'Y' to confirm or 'N' to try again: ").strip().lower()
 
-    if valid == 'Y':
-        return userApiKey
-    else:
-        # Recursively call the function if the user chooses to try again
-        return getUserApiKey()
+        if valid == 'y':
+            return userApiKey
 
 
 def getApiKey() -> str:
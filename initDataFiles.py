@@ -10,8 +10,8 @@ with precomputed file paths, eliminating the need for these initialization funct
 Dependencies:
     - `seriesIdParser.py`: Provides series ID and file path mappings.
     - `fredClient.py`: Handles API requests to the FRED database.
-    - `pandasHelperFunctions.py`: Converts Pandas Series to 2D lists.
-    - `time`: Used to pause requests to avoid rate limiter errors.
+    - `pandas`: Holds the flattened table of series to download.
+    - `concurrent.futures`: Runs series downloads in a thread pool; `FredApiClient` handles rate limiting.
 
 Data Storage Format:
     Each output file contains lines formatted as:
@@ -20,196 +20,352 @@ Data Storage Format:
         2000-06-28\0211.4984
         2000-07-05\0212.0107
 
+    With --parquet, each series is instead saved next to its text path as a zstd-compressed
+    Parquet file (e.g., data/H8/SAW/TOTCI.parquet) with a date index and a float64 "value" column.
+    The text format remains the default while the rest of the application reads text files, so
+    Parquet paths are recorded in parquetFilenames.txt instead of each report's filenames.txt.
+
 Usage:
-    Run the script to download and save the initial datasets.
+    Run the script to download and save the initial datasets:
+        python3 initDataFiles.py [--report {H8,H41,both}] [--parquet] [--verbose]
 
 Author: Emmet Szewczyk
 Date: 3/11/25
 """
 
+import os
+import logging
+import argparse
 from getApiKey import *
-from seriesIdParser import parseH8Series, parseH41Series
+from seriesIdParser import parseH8Series, parseH41Series, parseBothSeries
 from fredClient import FredApiClient
-from pandasHelperFunctions import seriesToTwoDimensionalList
-import time
+import pandas as pd
+from itertools import repeat
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from collections.abc import Mapping
+
+# Number of series downloaded concurrently
+MAX_DOWNLOAD_WORKERS = 8
+
+# File database name for each storage format; Parquet paths are kept out of the text-only filenames.txt
+FILE_DATABASE_NAMES = {
+    "text": "filenames.txt",
+    "parquet": "parquetFilenames.txt",
+}
+
+# Precomputed outline indentation for each depth of the H41 balance sheet
+INDENTS = tuple("  " * depth for depth in range(32))
 
-def saveH8FileNames(fileName: str) -> None:
+logger = logging.getLogger(__name__)
+
+def saveH8FileNames(fileNames: list, fileFormat: str = "text") -> None:
     """
-    This function writes the filename of a downloaded H8 data file to a file database
+    This function writes the filenames of downloaded H8 data files to a file database
     in data/H8/filenames.txt for easy access to data during application run time.
+    The database is opened once and all filenames are written together.
 
     Args:
-        filename (str): The file path to save in the H8 file database
+        fileNames (list): The file paths to save in the H8 file database
+        fileFormat (str): Storage format of the files; Parquet files are saved in data/H8/parquetFilenames.txt
     
     Returns:
-        None (Just writes filename to file)
+        None (Just writes filenames to file)
     """
-    saveFileNameTo = "data/H8/filenames.txt"
+    saveFileNameTo = f"data/H8/{FILE_DATABASE_NAMES[fileFormat]}"
 
     with open(saveFileNameTo, "a") as file:
-        file.write(fileName + "\n")
+        file.write("".join(fileName + "\n" for fileName in fileNames))
 
-def saveH41FileNames(fileName: str) -> None:
+def saveH41FileNames(fileNames: list, fileFormat: str = "text") -> None:
     """
-    This function writes the filename of a downloaded H41 data file to a file database
+    This function writes the filenames of downloaded H41 data files to a file database
     in data/H41/filenames.txt for easy access to data during application run time.
+    The database is opened once and all filenames are written together.
 
     Args:
-        filename (str): The file path to save in the H41 file database
+        fileNames (list): The file paths to save in the H41 file database
+        fileFormat (str): Storage format of the files; Parquet files are saved in data/H41/parquetFilenames.txt
     
     Returns:
-        None (Just writes filename to file)
+        None (Just writes filenames to file)
     """
-    saveFileNameTo = "data/H41/filenames.txt"
+    saveFileNameTo = f"data/H41/{FILE_DATABASE_NAMES[fileFormat]}"
 
     with open(saveFileNameTo, "a") as file:
-        file.write(fileName + "\n")
+        file.write("".join(fileName + "\n" for fileName in fileNames))
 
-def writeParsedDataToFile(fileName: str, parsedData: list) -> bool:
+def writeSeriesToFile(fileName: str, series) -> bool:
     """
-    Writes parsed time-series data to a file.
+    Writes a downloaded time series directly to a file.
+
+    Formatting is done by pandas, so no intermediate list of [date, value] pairs is built.
+    Lines are written in the "Date<null char>Value" format described above.
 
     Args:
         fileName (str): The file path where data should be stored.
-        parsedData (list): A list of [date, value] pairs.
+        series (pd.Series): The time series with dates as index and numeric values.
 
     Returns:
         bool: True if writing succeeds.
     """
     try:
-        with open(fileName, "w") as file:
-            for line in parsedData:
-                # Write each line in "Date<null char>Value\n" format
-                file.write(f"{line[0]}\0{line[1]}\n")
+        # Write each line in "Date<null char>Value\n" format
+        series.to_csv(fileName, sep="\0", header=False, date_format="%Y-%m-%d", lineterminator="\n", na_rep="nan")
         return True
     except Exception as e:
         print(f"Error writing to {fileName}: {e}")
         return False
 
-def downloadH8Data(H8_SeriesIds_Filepaths: dict, client: FredApiClient) -> None: 
+def writeSeriesParquet(fileName: str, series) -> bool:
     """
-    downloadH8Data
+    Writes a downloaded time series to a zstd-compressed Parquet file.
 
-    Downloads and saves time-series data for the H8 report using series IDs and file paths.
+    Dates are stored as timestamps and values as float64, so the file can be loaded
+    without any text parsing.
 
-    This function iterates through the structured dictionary of H8 series metadata, 
-    retrieves the corresponding data from the FRED API, and saves it to designated file paths. 
-    Upon succesful download, parsing, and file writing of time-series data, the function saves file names 
-    in a filename databse for the H8 data set.
+    Args:
+        fileName (str): The file path where data should be stored.
+        series (pd.Series): The time series with dates as index and numeric values.
 
-    To prevent exceeding API rate limits, it includes a delay between requests.
+    Returns:
+        bool: True if writing succeeds.
+    """
+    try:
+        frame = series.rename("value").rename_axis("date").to_frame()
+        frame.to_parquet(fileName, compression="zstd")
+        return True
+    except Exception as e:
+        print(f"Error writing to {fileName}: {e}")
+        return False
+
+# Series writer and file extension for each supported storage format
+SERIES_WRITERS = {
+    "text": (writeSeriesToFile, ".txt"),
+    "parquet": (writeSeriesParquet, ".parquet"),
+}
+
+# File database writer for each report
+FILE_DATABASES = {
+    "H8": saveH8FileNames,
+    "H41": saveH41FileNames,
+}
+
+def fetchAndWriteSeries(client: FredApiClient, seriesId: str, filePath: str, writeSeries=writeSeriesToFile) -> bool:
+    """
+    fetchAndWriteSeries
+
+    Downloads a single series from the FRED API and writes it to its file path.
+    This is the unit of work handed to the download thread pool, so it never raises; any
+    failure is reported and returned as False.
+
+    Parameters:
+        - client (FredApiClient): API client instance used to fetch the series data.
+        - seriesId (str): The FRED series ID to download.
+        - filePath (str): The file path where the series data should be stored.
+        - writeSeries (function): Writes the series to filePath and returns True on success.
+
+    Returns:
+        - bool: True if the series was downloaded and written successfully.
+    """
+    try:
+        # Fetch the time-series data from the FRED API
+        data = client.getSeries(seriesId)
+        if data is None:
+            print(f"    Failed to fetch data for {seriesId}")
+            return False
+
+        # Write the series to the corresponding file path
+        success = writeSeries(filePath, data)
+
+    except Exception as e:
+        print(f"Error fetching series {seriesId}: {e}")
+        return False
+
+    # Print confirmation
+    if success:
+        print(f"    Data for {seriesId} successfully written to: {filePath}")
+    else:
+        print(f"    Failed to write data for {seriesId} to {filePath}")
+
+    return success
+
+def iterH8Jobs(H8_SeriesIds_Filepaths: Mapping):
+    """
+    iterH8Jobs
+
+    Iterates through the structured dictionary of H8 series metadata and yields
+    a (seriesId, filePath) download job for each dataset. The categories and datasets
+    are logged at DEBUG level as they are collected.
 
     Parameters:
         - H8_SeriesIds_Filepaths (dict): 
             A nested dictionary where keys represent units & frequency categories 
             (e.g., "Weekly-SA") and values map dataset names to tuples of (seriesID, filePath).
-        - client (FredApiClient): 
-            An instance of `FredApiClient` used to fetch time-series data from the FRED database.
 
-    Returns:
-        - None (writes data to files and prints status messages).
+    Yields:
+        - tuple: (seriesId, filePath) for each H8 dataset.
     """
-    # Display metadata and begin downloading H8 series data
     for ufKey, datasets in H8_SeriesIds_Filepaths.items():
-        print(f"Units & Frequency: {ufKey}")  # Print the units and frequency (e.g., Weekly-SA)
+        logger.debug("Units & Frequency: %s", ufKey)  # Log the units and frequency (e.g., Weekly-SA)
         
         # Iterate through each dataset in the current frequency and unit category
         for dataset, (seriesID, filePath) in datasets.items():
-            print(f"  Dataset: {dataset}")  # Print the dataset name
+            logger.debug("  Dataset: %s", dataset)  # Log the dataset name
+            yield str(seriesID), filePath
 
-            # Fetch the time-series data from the FRED API using the series ID
-            data = client.getSeries(str(seriesID))
+def unwrapH41Dict(H41Data: Mapping, depth: int = 0):
+    """
+    unwrapH41Dict
 
-            # Convert the fetched data into a 2D list format (i.e., [[date, value], ...])
-            parsedData = seriesToTwoDimensionalList(data)
+    This function walks the structured dictionary of H41 series metadata with an explicit stack
+    instead of recursion, yielding a (seriesId, filePath) download job for each balance sheet line
+    that has a series. Lines are visited depth first in file order, and the balance sheet outline
+    is logged at DEBUG level so it costs nothing unless verbose output is enabled.
 
-            # Attempt to write the parsed data to the corresponding file path
-            success = writeParsedDataToFile(filePath, parsedData)
+    A line can carry its own series and also contain sub-lines, so dictionaries with a seriesId
+    are still searched for children. Only nested dictionaries are pushed; the seriesId and
+    filePath entries themselves are never walked.
 
-            # Check if writing data was successful and print the appropriate message
-            if success:
-                print(f"    Data for {seriesID} successfully written to: {filePath}")
-                saveH8FileNames(filePath) # Save the data file in file database for H8
-            else:
-                print(f"    Failed to write data for {seriesID} to {filePath}")
-            
-            # Pause for 5 seconds to avoid hitting API rate limits
-            time.sleep(5)
+    Parameters:
+        - H41Data (dict): A nested dictionary containing balance sheet lines, series IDs, and file paths.
+        - depth (int): The depth of H41Data in the full structure, used for the logged outline.
 
-def unwrapH41Dict(H41Data: dict, recursionDepth: int, client: FredApiClient):
+    Yields:
+        - tuple: (seriesId, filePath) for each series in H41Data.
     """
-    unwrapH41Dict
+    # Stack of (depth, balance sheet line, nested dictionary), pushed in reverse so lines pop in order
+    stack = deque((depth, key, value) for key, value in reversed(H41Data.items()) if isinstance(value, Mapping))
+    logOutline = logger.isEnabledFor(logging.DEBUG)
 
-    This function uses recursion to unwrap and retrieve seriesIds for data sets, and then
-    downloads, parses, and saves time-series data for the H41 report using series IDs and file paths.
+    while stack:
+        lineDepth, key, value = stack.pop()
+        if logOutline:
+            logger.debug("%s%d) Balance Sheet Line: %s", INDENTS[min(lineDepth, len(INDENTS) - 1)], lineDepth, key)
 
-    This function iterates through the structured dictionary of H41 series metadata, 
-    retrieves the corresponding data from the FRED API, and saves it to designated file paths in H41Data. 
-    Upon succesful download, parsing, and file writing of time-series data, the function saves file names 
-    in a filename databse for the H41 data set.
-    
-    To prevent exceeding API rate limits, it includes a delay between requests.
+        # If the dictionary contains a seriesId and filePath, queue the download
+        if 'seriesId' in value and 'filePath' in value:
+            yield value['seriesId'], value['filePath']
 
-    Parameters:
-        - H41Data (dict): A nested dictionary containing balance sheet lines, series IDs, and file paths.
-        - recursionDepth (int): Tracks the depth of recursion for structured printing.
-        - client (FredApiClient): API client instance used to fetch the series data.
+        # Queue nested balance sheet lines
+        stack.extend((lineDepth + 1, childKey, child) for childKey, child in reversed(value.items()) if isinstance(child, Mapping))
 
-    Returns:
-        - None (Downloads and writes data to files).
+def iterH41Jobs(H41_SeriesIds_Filepaths: Mapping):
     """
-    for key in H41Data:  # Iterate over keys
-        value = H41Data[key]  # Get the corresponding value
-        print(f"{'  ' * recursionDepth}{recursionDepth}) Balance Sheet Line: {key}")
+    iterH41Jobs
 
-        if isinstance(value, dict):
-            # If the dictionary contains a seriesId and filePath, download the data
-            if 'seriesId' in value and 'filePath' in value:
-                seriesId = value['seriesId']
-                filePath = value['filePath']
+    Iterates through every table of the H41 series metadata and yields a
+    (seriesId, filePath) download job for each series. Each table is logged at
+    DEBUG level before its balance sheet outline.
 
-                print(f"{'  ' * recursionDepth}    {recursionDepth}) Downloading Series ID: {seriesId}")
+    Parameters:
+        - H41_SeriesIds_Filepaths (dict): A dictionary mapping table numbers to nested balance sheet dictionaries.
 
-                # Fetch the time-series data from the FRED API
-                try:
-                    data = client.getSeries(seriesId, None, None, 6)
+    Yields:
+        - tuple: (seriesId, filePath) for each H41 series.
+    """
+    for tableNumber in H41_SeriesIds_Filepaths.keys():
+        logger.debug("Table: %s", tableNumber)
+        yield from unwrapH41Dict(H41_SeriesIds_Filepaths[tableNumber])
 
-                    # Convert data to a 2D list (e.g., [[date, value], ...])
-                    parsedData = seriesToTwoDimensionalList(data)
+def buildJobsTable(H8_SeriesIds_Filepaths: Mapping = None, H41_SeriesIds_Filepaths: Mapping = None) -> pd.DataFrame:
+    """
+    buildJobsTable
 
-                    # Write the parsed data to the corresponding file path
-                    success = writeParsedDataToFile(filePath, parsedData)
+    Flattens the H8 and H41 series metadata into a single table of download jobs, so the
+    downloader runs one loop over plain columns instead of walking nested dictionaries.
 
-                    # Print confirmation
-                    if success:
-                        print(f"{'  ' * recursionDepth}    {recursionDepth}) Data successfully written to: {filePath}")
-                        saveH41FileNames(filePath) # Save the data file in file database for H41
-                    else:
-                        print(f"{'  ' * recursionDepth}    {recursionDepth}) Failed to write data to: {filePath}")
+    Parameters:
+        - H8_SeriesIds_Filepaths (dict, optional): Categorized H8 series metadata from parseH8Series.
+        - H41_SeriesIds_Filepaths (dict, optional): Nested H41 series metadata from parseH41Series.
 
-                    # Pause for 5 seconds to avoid hitting API rate limits
-                    time.sleep(5)
+    Returns:
+        - pd.DataFrame: One row per series with columns "seriesId", "filePath", and "group"
+          (the report the series belongs to, "H8" or "H41").
+    """
+    seriesIds, filePaths, groups = [], [], []
 
-                except Exception as e:
-                    print(f"Error fetching series {seriesId}: {e}")
+    for group, jobs in (("H8", iterH8Jobs(H8_SeriesIds_Filepaths or {})),
+                        ("H41", iterH41Jobs(H41_SeriesIds_Filepaths or {}))):
+        for seriesId, filePath in jobs:
+            seriesIds.append(seriesId)
+            filePaths.append(filePath)
+            groups.append(group)
 
-            # Continue recursive traversal for nested elements
-            unwrapH41Dict(value, recursionDepth + 1, client)
+    return pd.DataFrame({"seriesId": seriesIds, "filePath": filePaths, "group": groups})
 
-# Set up API key and client
-apiKey = getApiKey()
-client = FredApiClient(apiKey)
+def downloadSeries(jobsTable: pd.DataFrame, client: FredApiClient, fileFormat: str = "text") -> None:
+    """
+    downloadSeries
 
-# Get series IDs and file paths for H8 Dataset
-H8_SeriesIds_Filepaths = parseH8Series()
+    Downloads, parses, and saves time-series data for every series in a jobs table.
 
-# Download and Save the H8 Data
-downloadH8Data(H8_SeriesIds_Filepaths, client)
+    Series are downloaded concurrently using a thread pool. Requests are I/O-bound, so several
+    can be in flight at once; pacing is left entirely to the client's rate limiter.
+    Upon succesful download and file writing of time-series data, file names are saved to
+    each report's filename database in one write once every download has finished.
 
-# Get series IDs and file paths for H41 Dataset
-H41_SeriesIds_Filepaths = parseH41Series()
+    Parameters:
+        - jobsTable (pd.DataFrame): Download jobs with "seriesId", "filePath", and "group" columns (see buildJobsTable).
+        - client (FredApiClient): API client instance used to fetch the series data.
+        - fileFormat (str): Storage format for the series, a key of SERIES_WRITERS ("text" or "parquet").
 
-# Download and Save the H41 Data
-for tableNumber in H41_SeriesIds_Filepaths.keys():
-    print(f"Downloading {tableNumber}")
-    unwrapH41Dict(H41_SeriesIds_Filepaths[tableNumber], 0, client)
\ No newline at end of file
+    Returns:
+        - None (Downloads and writes data to files).
+    """
+    writeSeries, extension = SERIES_WRITERS[fileFormat]
+
+    seriesIds = jobsTable["seriesId"].tolist()
+    groups = jobsTable["group"].tolist()
+
+    # Swap each file path's extension for the one used by the storage format
+    filePaths = [os.path.splitext(filePath)[0] + extension for filePath in jobsTable["filePath"].tolist()]
+
+    for group in FILE_DATABASES:
+        if group in groups:
+            print(f"Downloading {groups.count(group)} {group} series")
+
+    with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+        results = list(executor.map(fetchAndWriteSeries, repeat(client), seriesIds, filePaths, repeat(writeSeries)))
+
+    # Save the downloaded file paths in each report's file database
+    for group, saveFileNames in FILE_DATABASES.items():
+        savedFilePaths = [filePath for filePath, jobGroup, success in zip(filePaths, groups, results)
+                          if success and jobGroup == group]
+        if savedFilePaths:
+            saveFileNames(savedFilePaths, fileFormat)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Download and save the H8 and H41 series from FRED.")
+    parser.add_argument("--report", choices=["H8", "H41", "both"], default="both",
+                        help="Which report's series to download (default: both).")
+    parser.add_argument("--parquet", action="store_true",
+                        help="Save series as Parquet files instead of the legacy null-delimited text files.")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Print the H8 and H41 series outlines while collecting series.")
+    args = parser.parse_args()
+
+    # Only this module logs at DEBUG; enabling it on the root logger would also turn on urllib3's
+    # request logging, which prints every request URL including the API key
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
+    logger.propagate = False
+
+    fileFormat = "parquet" if args.parquet else "text"
+
+    # Set up API key and client
+    apiKey = getApiKey()
+    client = FredApiClient(apiKey)
+
+    # Get series IDs and file paths for the selected Datasets
+    if args.report == "both":
+        H8_SeriesIds_Filepaths, H41_SeriesIds_Filepaths = parseBothSeries()
+    else:
+        H8_SeriesIds_Filepaths = parseH8Series() if args.report == "H8" else None
+        H41_SeriesIds_Filepaths = parseH41Series() if args.report == "H41" else None
+
+    # Download and Save the selected Data
+    jobsTable = buildJobsTable(H8_SeriesIds_Filepaths, H41_SeriesIds_Filepaths)
+    downloadSeries(jobsTable, client, fileFormat)
@@ -15,19 +15,73 @@ File Format Assumption (H8_Series_Ids.txt and H41_Series_Ids.txt):
     - Table Number-Balance Sheet Section(s)-Series ID
 
 Functions:
+    - createFilePath(report, directory, seriesId): Generates the data file path shared by both reports.
     - createH8FilePath(frequency, units, seriesId): Generates a standardized file path.
     - createH41FilePath(tableNumber, seriesId): Generates a file path for a given table and series ID.
-    - initDicts(parsedLine, weeklySA, weeklyNSA, monthlySA, monthlyNSA): 
-      Parses metadata and stores (series ID, file path) in the appropriate dictionary.
-    - getSeriesIdsAndFilepaths(): Reads the input file and returns a structured dictionary.
-    - initH41Dict(parsedLine, currentTable, reserveBalanceSheet): 
-      Initializes and updates the hierarchical dictionary with series data.
-    - parseH41Series(): Parses the H41 series file and builds a nested dictionary.
+    - loadH8Series(): Reads the H8 series file and returns the categorized dictionaries.
+    - parseH8Series(): Returns the loaded H8 dictionaries as a read-only view.
+    - parseH8SeriesFrame(): Returns the H8 series as a flat DataFrame.
+    - loadH41Series(): Parses the H41 series file and builds a nested dictionary.
+    - parseH41Series(): Returns the loaded H41 dictionary as a read-only view.
+    - readMetadataLines(seriesIdFile): Yields the fields of each line in a series ID file.
+    - freezeSeriesDict(data): Wraps a parsed dictionary in read-only views.
+    - internSeriesKeys(data): Interns the keys of a dictionary decoded from the cache.
+    - parseBothSeries(): Parses the H8 and H41 series files concurrently.
+    - mtimeCached(sourcePath, cachePath, resultType, afterDecode): Caches a parse result on disk until its source file changes.
+
+Both parse functions are memoized, so the series files are only read once per process.
+Their results are also cached as msgpack under .cache/seriesIds, so later runs skip parsing until
+a series ID file is modified.
+The module is fully type annotated so it can be compiled with mypyc (`make build-parser`).
+
+Performance Notes:
+    Parsing is I/O and allocation bound, not compute bound: lines are only tens of bytes,
+    and the time goes to reading the files and creating small strings, lists, and
+    dictionaries. Optimizations should reduce reads and per-line allocations (caching,
+    interning) rather than the arithmetic, of which there is almost none.
 
 Author: Emmet Szewczyk
 Date: 3/11/25
 """
 
+import os
+import sys
+import functools
+import msgspec
+import pandas as pd
+from types import MappingProxyType
+from fileManager import atomicWritePath
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, Mapping, TypeVar
+
+# Category of each (frequency, units) combination, which is also the data directory of its series
+H8_DIRECTORIES: dict[tuple[str, str], str] = {
+    ("Weekly", "SA"): "SAW",
+    ("Weekly", "NSA"): "NSAW",
+    ("Monthly", "SA"): "SAM",
+    ("Monthly", "NSA"): "NSAM",
+}
+
+# Directory for the cached parse results, and the version of their layout
+SERIES_CACHE_DIR = ".cache/seriesIds"
+SERIES_CACHE_VERSION = 1
+
+T = TypeVar("T")
+
+def createFilePath(report: str, directory: str, seriesId: str) -> str:
+    """
+    Generates the file path for storing a series of either report.
+
+    Args:
+        report (str): The report the series belongs to ("H8" or "H41").
+        directory (str): The directory within the report (e.g., "SAW" or "table1").
+        seriesId (str): Unique identifier for the series.
+
+    Returns:
+        str: The formatted file path for storing the series data.
+    """
+    return f"data/{report}/{directory}/{seriesId}.txt"
+
 def createH8FilePath(frequency: str, units: str, seriesId: str) -> str:
     """
     Generates a standardized file path for storing H8 series data.
@@ -40,7 +94,11 @@ def createH8FilePath(frequency: str, units: str, seriesId: str) -> str:
     Returns:
         str: The formatted file path for storing the series data.
     """
-    return f"data/H8/{units.upper()}{frequency[0].upper()}/{seriesId}.txt"
+    directory = H8_DIRECTORIES.get((frequency, units))
+    if directory is None:
+        directory = f"{units.upper()}{frequency[0].upper()}"  # Build the directory for uncommon spellings
+
+    return createFilePath("H8", directory, seriesId)
 
 def createH41FilePath(tableNumber: str, seriesId: str) -> str:
     """
@@ -53,87 +111,130 @@ def createH41FilePath(tableNumber: str, seriesId: str) -> str:
     Returns:
         str: A formatted file path for the specified table and series ID.
     """
-    return f"data/H41/{tableNumber}/{seriesId}.txt"
+    return createFilePath("H41", tableNumber, seriesId)
+
+def readMetadataLines(seriesIdFile: str) -> Iterator[list[str]]:
+    """
+    Yields the '-' separated fields of each non-empty line in a series ID file.
+
+    Args:
+        seriesIdFile (str): Path to the series ID file.
+
+    Yields:
+        list: The stripped fields of a line (e.g., [Dataset Name, Frequency, Units, Series ID]).
+    """
+    with open(seriesIdFile, "r", encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()  # Remove leading/trailing spaces and newline characters
+            if not line:
+                continue  # Skip empty lines
 
+            yield [part.strip() for part in line.split("-")]  # Split on '-'
 
-def initH8Dicts(parsedLine: list, weeklySA: dict, weeklyNSA: dict, monthlySA: dict, monthlyNSA: dict) -> None:
+def freezeSeriesDict(data: Mapping[str, Any]) -> MappingProxyType[str, Any]:
     """
-    Parses a metadata line of H8 information and categorizes the series ID into the appropriate dictionary.
+    Recursively wraps a parsed series dictionary in read-only views.
+
+    The parse functions are cached, so every caller receives the same object. Freezing it
+    prevents one caller's changes from corrupting the cached result for the others.
 
     Args:
-        parsed_line (list): List of metadata components (Dataset, Frequency, Units, Series ID).
-        weeklySA (dict): Dictionary to store weekly seasonally adjusted series.
-        weeklyNSA (dict): Dictionary to store weekly non-seasonally adjusted series.
-        monthlySA (dict): Dictionary to store monthly seasonally adjusted series.
-        monthlyNSA (dict): Dictionary to store monthly non-seasonally adjusted series.
+        data (dict): The dictionary to freeze. Nested dictionaries are frozen and lists become tuples.
 
     Returns:
-        None: Updates the respective dictionary in place.
-    """
-    if len(parsedLine) < 4:
-        print(f"Warning: Malformed line detected - {parsedLine}")
-        return
-
-    # Extract metadata elements
-    datasetName = parsedLine[0].strip()
-    frequency = parsedLine[-3].strip()
-    units = parsedLine[-2].strip()
-    seriesId = parsedLine[-1].strip()
-
-    # Generate file path
-    filePath = createH8FilePath(frequency, units, seriesId)
-
-    # Select the appropriate dictionary
-    targetDict = None
-    if frequency == "Weekly" and units == "SA":
-        targetDict = weeklySA
-    elif frequency == "Weekly" and units == "NSA":
-        targetDict = weeklyNSA
-    elif frequency == "Monthly" and units == "SA":
-        targetDict = monthlySA
-    elif frequency == "Monthly" and units == "NSA":
-        targetDict = monthlyNSA
-
-    # Store series ID in the dictionary
-    if targetDict is not None:
-        if datasetName not in targetDict:
-            targetDict[datasetName] = []  # Initialize an empty list
-        targetDict[datasetName].append(seriesId)
-        targetDict[datasetName].append(filePath)
-
-def initH41Dict(parsedLine: list, currentTable: str, reserveBalanceSheet: dict) -> None:
-    """
-    Populates the hierarchical reserve balance sheet dictionary with series data from H41.
-
-    This function navigates the nested dictionary structure and inserts series IDs
-    with their corresponding file paths.
+        MappingProxyType: A read-only view of the frozen dictionary.
+    """
+    frozen: dict[str, Any] = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            frozen[key] = freezeSeriesDict(value)
+        elif isinstance(value, list):
+            frozen[key] = tuple(value)
+        else:
+            frozen[key] = value
+    return MappingProxyType(frozen)
+
+def internSeriesKeys(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Rebuilds a nested series dictionary decoded from the cache with interned keys.
+
+    loadH41Series interns each level as it is created, but msgspec decodes long keys as new
+    strings, so a section name repeated across tables would otherwise be stored once per use.
 
     Args:
-        parsedLine (list): A list representing hierarchical levels of the series.
-        currentTable (str): The table number associated with the series.
-        reserveBalanceSheet (dict): The main dictionary storing the H41 series data.
+        data (dict): The decoded dictionary.
 
     Returns:
-        None
+        dict: The same structure with every key interned.
     """
-    currentLevel = reserveBalanceSheet  # Start from the root of the dictionary
+    return {sys.intern(key): internSeriesKeys(value) if isinstance(value, dict) else value
+            for key, value in data.items()}
 
-    # Iterate through all levels except the last one (which is the series ID)
-    for level in parsedLine[:-1]:
-        if level not in currentLevel:
-            currentLevel[level] = {}  # Create a new nested dictionary if it doesn't exist
-        currentLevel = currentLevel[level]  # Move deeper into the structure
+CACHE_ENCODER = msgspec.msgpack.Encoder()
 
-    # Assign the last element (series ID) along with the generated file path
-    seriesId = parsedLine[-1]
-    currentLevel["seriesId"] = seriesId
-    currentLevel["filePath"] = createH41FilePath(currentTable, seriesId)
+def mtimeCached(sourcePath: str, cachePath: str, resultType: Any,
+                afterDecode: Callable[[Any], Any] | None = None) -> Callable[[Callable[[], T]], Callable[[], T]]:
+    """
+    Caches the result of a parse function on disk until its source file is modified.
+
+    The result is encoded with msgspec's msgpack encoder together with the source file's
+    modification time. A later call (in this or another process) decodes the cache file
+    instead of parsing again, as long as the recorded modification time still matches.
+    The version and modification time are checked before the result is decoded, so cache
+    files written with an older layout are simply replaced. Cache failures are reported but
+    never raised.
+
+    Args:
+        sourcePath (str): The file read by the decorated function.
+        cachePath (str): The msgpack file to store the result in.
+        resultType (type): The return type of the decorated function, used as the decoding schema.
+        afterDecode (Callable, optional): Applied to a result decoded from the cache file before it is returned.
 
-def parseH8Series() -> dict:
+    Returns:
+        Callable: A decorator for a parse function that takes no arguments.
+    """
+    headerDecoder = msgspec.msgpack.Decoder(tuple[int, int, msgspec.Raw])  # Leaves the result undecoded
+    resultDecoder = msgspec.msgpack.Decoder(resultType)
+
+    def decorator(parse: Callable[[], T]) -> Callable[[], T]:
+        @functools.wraps(parse)
+        def wrapper() -> T:
+            sourceMtime = os.stat(sourcePath).st_mtime_ns
+
+            try:
+                with open(cachePath, "rb") as cacheFile:
+                    version, cachedMtime, rawResult = headerDecoder.decode(cacheFile.read())
+                if version == SERIES_CACHE_VERSION and cachedMtime == sourceMtime:
+                    cachedResult = resultDecoder.decode(rawResult)
+                    return afterDecode(cachedResult) if afterDecode is not None else cachedResult  # type: ignore[no-any-return]
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Warning: Could not read cache file {cachePath}: {e}")
+
+            result = parse()
+
+            try:
+                os.makedirs(os.path.dirname(cachePath), exist_ok=True)
+                with atomicWritePath(cachePath) as tempPath, open(tempPath, "wb") as cacheFile:
+                    cacheFile.write(CACHE_ENCODER.encode((SERIES_CACHE_VERSION, sourceMtime, result)))
+            except Exception as e:
+                print(f"Warning: Could not write cache file {cachePath}: {e}")
+
+            return result
+        return wrapper
+    return decorator
+
+@mtimeCached("data/H8_Series_Ids.txt", f"{SERIES_CACHE_DIR}/H8_Series_Ids.msgpack", dict[str, dict[str, list[str]]])
+def loadH8Series() -> dict[str, dict[str, list[str]]]:
     """
     Reads the H8_Series_Ids.txt file, parses its contents, and categorizes the series IDs 
     into four dictionaries based on frequency and seasonal adjustment type.
 
+    Each line has the four fields Dataset Name-Frequency-Units-Series ID. Fields are split
+    from the right, so a dataset name may contain '-'. Lines with fewer than four fields are
+    skipped with a warning.
+
     Returns:
         dict: A dictionary containing four categorized series ID mappings:
               - "SAW": Weekly Seasonally Adjusted
@@ -144,24 +245,78 @@ def parseH8Series() -> dict:
     seriesIdFile = "data/H8_Series_Ids.txt"
 
     # Dictionaries for categorized series IDs
-    weeklySA, monthlySA, weeklyNSA, monthlyNSA = {}, {}, {}, {}
+    categorized: dict[str, dict[str, list[str]]] = {category: {} for category in ("SAW", "SAM", "NSAW", "NSAM")}
 
     # Open the file and process its contents
-    with open(seriesIdFile, "r") as file:
+    with open(seriesIdFile, "r", encoding="utf-8") as file:
         for line in file:
             line = line.strip()  # Remove leading/trailing spaces and newline characters
             if not line:
                 continue  # Skip empty lines
-            
-            parsedLine = [part.strip() for part in line.split("-")]  # Split on '-'
 
-            # Update dictionaries
-            initH8Dicts(parsedLine, weeklySA, weeklyNSA, monthlySA, monthlyNSA)
+            # Split from the right, so dataset names may contain '-' themselves
+            parsedLine = [part.strip() for part in line.rsplit("-", 3)]
+            if len(parsedLine) < 4:
+                print(f"Warning: Malformed line detected - {parsedLine}")
+                continue
+
+            datasetName, frequency, units, seriesId = parsedLine
+
+            # Select the appropriate dictionary; unknown combinations are skipped
+            category = H8_DIRECTORIES.get((frequency, units))
+            if category is None:
+                continue
+
+            # Store series ID and file path in the dictionary
+            filePath = createH8FilePath(frequency, units, seriesId)
+            categorized[category].setdefault(datasetName, []).extend((seriesId, filePath))
 
     # Return categorized dictionaries
-    return {"SAW": weeklySA, "SAM": monthlySA, "NSAW": weeklyNSA, "NSAM": monthlyNSA}
+    return categorized
+
+@functools.lru_cache(maxsize=1)
+def parseH8Series() -> MappingProxyType[str, Any]:
+    """
+    Returns the categorized H8 series IDs and file paths built by loadH8Series.
+
+    Returns:
+        MappingProxyType: A read-only dictionary containing four categorized series ID mappings:
+              - "SAW": Weekly Seasonally Adjusted
+              - "SAM": Monthly Seasonally Adjusted
+              - "NSAW": Weekly Non-Seasonally Adjusted
+              - "NSAM": Monthly Non-Seasonally Adjusted
+    """
+    return freezeSeriesDict(loadH8Series())
+
+def parseH8SeriesFrame() -> pd.DataFrame:
+    """
+    Returns the categorized H8 series as a flat table instead of nested dictionaries.
+
+    Each pair in the parseH8Series dictionaries becomes one row, so callers can filter
+    with column comparisons (e.g., frame[frame["category"] == "SAW"]) instead of walking
+    the dictionaries. A new DataFrame is built on every call, so callers may modify it.
 
-def parseH41Series() -> dict:
+    Returns:
+        pd.DataFrame: One row per series with columns "category", "dataset", "seriesId", and "filePath".
+    """
+    categories: list[str] = []
+    datasets: list[str] = []
+    seriesIds: list[str] = []
+    filePaths: list[str] = []
+
+    for category, categoryDatasets in parseH8Series().items():
+        for datasetName, pairs in categoryDatasets.items():
+            # Pairs are stored flat as (seriesId, filePath, seriesId, filePath, ...)
+            for index in range(0, len(pairs), 2):
+                categories.append(category)
+                datasets.append(datasetName)
+                seriesIds.append(pairs[index])
+                filePaths.append(pairs[index + 1])
+
+    return pd.DataFrame({"category": categories, "dataset": datasets, "seriesId": seriesIds, "filePath": filePaths})
+
+@mtimeCached("data/H41_Series_Ids.txt", f"{SERIES_CACHE_DIR}/H41_Series_Ids.msgpack", dict[str, Any], internSeriesKeys)
+def loadH41Series() -> dict[str, Any]:
     """
     Parses the H41 series data file and builds a nested dictionary.
 
@@ -171,19 +326,48 @@ def parseH41Series() -> dict:
     Returns:
         dict: A nested dictionary representing the parsed H41 series data.
     """
-    reserveBalanceSheet = {}  # Initialize the main dictionary
+    reserveBalanceSheet: dict[str, Any] = {}  # Initialize the main dictionary
 
     seriesIdFile = "data/H41_Series_Ids.txt"  # File containing series ID mappings
 
-    with open(seriesIdFile, "r") as file:
-        for line in file:
-            line = line.strip()  # Remove leading/trailing spaces and newline characters
-            if not line:
-                continue  # Skip empty lines
+    # Process the hierarchy fields of each line in the file
+    for parsedLine in readMetadataLines(seriesIdFile):
+        currentLevel = reserveBalanceSheet  # Start from the root of the dictionary
 
-            parsedLine = [part.strip() for part in line.split("-")]  # Split hierarchy by '-'
+        # Iterate through all levels except the last one (which is the series ID)
+        for level in parsedLine[:-1]:
+            if level not in currentLevel:
+                currentLevel[sys.intern(level)] = {}  # Create the level, interning its name once
+            currentLevel = currentLevel[level]  # Move deeper into the structure
 
-            # Populate the dictionary with parsed data
-            initH41Dict(parsedLine, parsedLine[0], reserveBalanceSheet)
+        # Assign the series ID along with the generated file path
+        seriesId = parsedLine[-1]
+        currentLevel["seriesId"] = seriesId
+        currentLevel["filePath"] = createH41FilePath(parsedLine[0], seriesId)
 
-    return reserveBalanceSheet
\ No newline at end of file
+    return reserveBalanceSheet
+
+@functools.lru_cache(maxsize=1)
+def parseH41Series() -> MappingProxyType[str, Any]:
+    """
+    Returns the nested H41 series data built by loadH41Series.
+
+    Returns:
+        MappingProxyType: A read-only nested dictionary representing the parsed H41 series data.
+    """
+    return freezeSeriesDict(loadH41Series())
+
+def parseBothSeries() -> tuple[MappingProxyType[str, Any], MappingProxyType[str, Any]]:
+    """
+    Parses the H8 and H41 series files concurrently.
+
+    The two files have no dependency on each other, so reading them in separate threads
+    overlaps their file I/O instead of waiting for one file before starting the other.
+
+    Returns:
+        tuple: The results of parseH8Series() and parseH41Series(), in that order.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        H8Future = executor.submit(parseH8Series)
+        H41Future = executor.submit(parseH41Series)
+        return H8Future.result(), H41Future.result()
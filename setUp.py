@@ -1,3 +1,4 @@
+import os
 from datetime import datetime, timedelta
 from fileManager import readFromFile
 
@@ -19,22 +20,78 @@ def getFilePaths() -> tuple[list, list]:
     return H41_Filepaths, H8_Filepaths
 
 
+def parseIsoDate(dateString: str) -> datetime:
+    """
+    Parses a "YYYY-MM-DD" date string without going through datetime.strptime.
+
+    :param dateString: The date string to parse.
+    :return: The parsed date as a datetime at midnight.
+    :raises ValueError: If dateString is not a valid "YYYY-MM-DD" date.
+    """
+    year, month, day = dateString[0:4], dateString[5:7], dateString[8:10]
+
+    # int() also accepts signs, spaces, and non-ASCII digits, so check for plain digits first
+    digits = year + month + day
+    if (len(dateString) != 10 or dateString[4] != "-" or dateString[7] != "-"
+            or not (digits.isascii() and digits.isdigit())):
+        raise ValueError(f"Invalid date: {dateString!r}")
+
+    return datetime(int(year), int(month), int(day))
+
+
+def readLastLine(filePath: str, chunkSize: int = 4096) -> bytes:
+    """
+    Reads the last non-empty line of a file by reading backwards from the end,
+    so the cost does not grow with the size of the file.
+
+    :param filePath: Path to the file.
+    :param chunkSize: Number of bytes read from the end of the file at a time.
+    :return: The last non-empty line without its line ending, or b"" if the file has none.
+    """
+    with open(filePath, "rb") as file:
+        file.seek(0, os.SEEK_END)
+        fileSize = file.tell()
+        tail = b""
+
+        # Extend the tail until it holds a complete last line or the whole file
+        while len(tail) < fileSize:
+            readSize = min(chunkSize, fileSize - len(tail))
+            file.seek(fileSize - len(tail) - readSize)
+            tail = file.read(readSize) + tail
+
+            lines = tail.rstrip().rsplit(b"\n", 1)
+            if len(lines) == 2:
+                return lines[1].strip()
+
+    return tail.strip()
+
+
 def checkLastDataDownload(filePath: str) -> bool:
     """
     Checks if the last data download recorded in the file was within the last 7 days.
 
+    Only the end of the file is read, since just the last record's date is needed.
+
     :param filePath: Path to the file containing download dates.
     :return: True if the last recorded download was within the last 7 days, False otherwise.
     """
 
-    # Open the file and download content:
-    fileData = readFromFile(filePath, "\0")
+    # Read the last record in the file
+    try:
+        lastLine = readLastLine(filePath)
+    except FileNotFoundError:
+        print(f"Warning: {filePath} not found. Returning False.")
+        return False
 
-    lastDownloadDate = fileData[-1][0]  # Extract last recorded date
+    if not lastLine:
+        print(f"Warning: {filePath} is empty. Returning False.")
+        return False
+
+    lastDownloadDate = lastLine.split(b"\0")[0].decode()  # Extract last recorded date
     print(f"Last Download Date: {lastDownloadDate}")
 
     try:
-        lastDownloadDate = datetime.strptime(lastDownloadDate, "%Y-%m-%d")  # Convert to datetime
+        lastDownloadDate = parseIsoDate(lastDownloadDate)  # Convert to datetime
     except ValueError:
         print(f"Error: Invalid date format in {filePath}. Returning False.")
         return False
@@ -43,4 +100,3 @@ def checkLastDataDownload(filePath: str) -> bool:
     sevenDaysAgo = datetime.today() - timedelta(days=7)
     
     return lastDownloadDate >= sevenDaysAgo
-